@@ -12,7 +12,8 @@ Classes:
 
 """
 
-from encoding.utils import TextEncoder
+from encoding.utils import TextEncoder, _validate_text, _check_cache_size, _cache_text_method
+import math
 import numpy as np
 
 
@@ -23,23 +24,33 @@ class CaesarCipher(metaclass=TextEncoder):
     Attributes:
         shift (int): The number of positions to shift each character.
         alpha_only (bool): Whether to encode only alphabetic characters.
+        validate (bool): Whether to check that the text only contains printable ASCII characters.
+        cache_size (int): The number of recent texts whose results are cached. 0 disables caching.
 
     Methods:
         encode(text): Encodes the given text using the Caesar Cipher.
         decode(text): Decodes the given text using the Caesar Cipher.
     """
 
-    def __init__(self, shift: int = 3, alpha_only: bool = False):
+    def __init__(self, shift: int = 3, alpha_only: bool = False, validate: bool = True, cache_size: int = 0):
         """
         Initializes the CaesarCipher with the specified shift and mode.
 
         Args:
             shift (int): The number of positions to shift each character. Default is 3.
             alpha_only (bool): Whether to encode only alphabetic characters. Default is False.
+            validate (bool): Whether to check that the text only contains printable ASCII characters. Default is True.
+            cache_size (int): The number of recent texts whose results are cached. 0 disables caching. Default is 0.
         """
         self.shift = shift
         self.alpha_only = alpha_only
+        self.validate = validate
+        self.__table_params = None
 
+        _check_cache_size(cache_size)
+        self.cache_size = cache_size
+
+    @_cache_text_method('shift', 'alpha_only', 'validate')
     def encode(self, text: str) -> str:
         """
         Encodes the given text using the Caesar Cipher.
@@ -56,26 +67,12 @@ class CaesarCipher(metaclass=TextEncoder):
         if not text:
             return text
 
-        if not any(32 <= ord(char) <= 126 for char in text):
-            raise ValueError("Text Encoders cannot handle characters with ASCII < 32 or ASCII > 127")
-        enc_text = ""
+        if self.validate:
+            _validate_text(text)
 
-        for i in text:
-            ascii_val = ord(i)
-            if self.alpha_only:
-                char_value = ascii_val + self.shift
-                if 65 <= ascii_val <= 90:
-                    rep_letter = chr(char_value) if char_value <= 90 else chr(char_value - 26)
-                elif 97 <= ascii_val <= 122:
-                    rep_letter = chr(char_value) if char_value <= 122 else chr(char_value - 26)
-                else:
-                    rep_letter = i
-            else:
-                rep_letter = chr(((ascii_val - 32 + self.shift) % 95) + 32)
-            enc_text += rep_letter
-
-        return enc_text
+        return text.translate(self.__get_tables()[0])
 
+    @_cache_text_method('shift', 'alpha_only', 'validate')
     def decode(self, text: str) -> str:
         """
         Decodes the given text using the Caesar Cipher.
@@ -92,25 +89,47 @@ class CaesarCipher(metaclass=TextEncoder):
         if not text:
             return text
 
-        if not any(32 <= ord(char) <= 126 for char in text):
-            raise ValueError("Text Encoders cannot handle characters with ASCII < 32 or ASCII > 127")
+        if self.validate:
+            _validate_text(text)
 
-        dec_text = ""
-        for i in text:
-            ascii_val = ord(i)
-            if self.alpha_only:
-                char_val = ascii_val - self.shift
-                if 65 <= ascii_val <= 90:
-                    rep_letter = chr(char_val) if char_val >= 65 else chr(char_val + 26)
-                elif 97 <= ascii_val <= 122:
-                    rep_letter = chr(char_val) if char_val >= 97 else chr(char_val + 26)
-                else:
-                    rep_letter = i
-            else:
-                rep_letter = chr(((ascii_val - 32 - self.shift) % 95) + 32)
-            dec_text += rep_letter
+        return text.translate(self.__get_tables()[1])
 
-        return dec_text
+    def __get_tables(self) -> tuple:
+        """
+        Returns the encoding and decoding translation tables, rebuilding them if `shift` or `alpha_only` has changed
+        since they were last built.
+
+        Returns:
+            tuple: The encoding and decoding translation tables.
+        """
+        params = (self.shift, self.alpha_only)
+        if params != self.__table_params:
+            self.__tables = (str.maketrans(self.__get_mapping(self.shift)),
+                             str.maketrans(self.__get_mapping(-self.shift)))
+            self.__table_params = params
+
+        return self.__tables
+
+    def __get_mapping(self, shift: int) -> dict:
+        """
+        Generates the character mapping of the Caesar Cipher for the printable ASCII range.
+
+        Args:
+            shift (int): The number of positions to shift each character.
+
+        Returns:
+            dict: The mapping of each ASCII value to its replacement character.
+        """
+        mapping = {}
+        for ascii_val in range(32, 127):
+            if not self.alpha_only:
+                mapping[ascii_val] = chr((ascii_val - 32 + shift) % 95 + 32)
+            elif 65 <= ascii_val <= 90:
+                mapping[ascii_val] = chr((ascii_val - 65 + shift) % 26 + 65)
+            elif 97 <= ascii_val <= 122:
+                mapping[ascii_val] = chr((ascii_val - 97 + shift) % 26 + 97)
+
+        return mapping
 
 
 class AtbashCipher(metaclass=TextEncoder):
@@ -119,21 +138,31 @@ class AtbashCipher(metaclass=TextEncoder):
 
     Attributes:
         alpha_only (bool): Whether to encode only alphabetic characters.
+        validate (bool): Whether to check that the text only contains printable ASCII characters.
+        cache_size (int): The number of recent texts whose results are cached. 0 disables caching.
 
     Methods:
         encode(text): Encodes the given text using the Atbash Cipher.
         decode(text): Decodes the given text using the Atbash Cipher.
     """
 
-    def __init__(self, alpha_only: bool = False):
+    def __init__(self, alpha_only: bool = False, validate: bool = True, cache_size: int = 0):
         """
         Initializes the AtbashCipher with the specified mode.
 
         Args:
             alpha_only (bool): Whether to encode only alphabetic characters. Default is False.
+            validate (bool): Whether to check that the text only contains printable ASCII characters. Default is True.
+            cache_size (int): The number of recent texts whose results are cached. 0 disables caching. Default is 0.
         """
         self.alpha_only = alpha_only
+        self.validate = validate
+        self.__table_params = None
 
+        _check_cache_size(cache_size)
+        self.cache_size = cache_size
+
+    @_cache_text_method('alpha_only', 'validate')
     def encode(self, text: str) -> str:
         """
         Encodes the given text using the Atbash Cipher.
@@ -150,26 +179,12 @@ class AtbashCipher(metaclass=TextEncoder):
         if not text:
             return text
 
-        if not any(32 <= ord(char) <= 126 for char in text):
-            raise ValueError("Text Encoders cannot handle characters with ASCII < 32 or ASCII > 127")
-
-        enc_text = ""
-
-        for i in text:
-            ascii_val = ord(i)
-            if self.alpha_only:
-                if 65 <= ascii_val <= 90:
-                    rep_letter = chr(155 - ascii_val)
-                elif 97 <= ascii_val <= 122:
-                    rep_letter = chr(219 - ascii_val)
-                else:
-                    rep_letter = i
-            else:
-                rep_letter = chr(126 - (ascii_val - 32))
-            enc_text += rep_letter
+        if self.validate:
+            _validate_text(text)
 
-        return enc_text
+        return text.translate(self.__get_table())
 
+    @_cache_text_method('alpha_only', 'validate')
     def decode(self, text: str) -> str:
         """
         Decodes the given text using the Atbash Cipher.
@@ -186,11 +201,40 @@ class AtbashCipher(metaclass=TextEncoder):
         if not text:
             return text
 
-        if not any(32 <= ord(char) <= 126 for char in text):
-            raise ValueError("Text Encoders cannot handle characters with ASCII < 32 or ASCII > 127")
-
         return self.encode(text=text)
 
+    def __get_table(self) -> dict:
+        """
+        Returns the translation table, rebuilding it if `alpha_only` has changed since it was last built.
+
+        Returns:
+            dict: The translation table.
+        """
+        if self.alpha_only != self.__table_params:
+            self.__table = str.maketrans(self.__get_mapping())
+            self.__table_params = self.alpha_only
+
+        return self.__table
+
+    def __get_mapping(self) -> dict:
+        """
+        Generates the character mapping of the Atbash Cipher for the printable ASCII range.
+
+        Returns:
+            dict: The mapping of each ASCII value to its replacement character.
+        """
+        mapping = {}
+        for ascii_val in range(32, 127):
+            if self.alpha_only:
+                if 65 <= ascii_val <= 90:
+                    mapping[ascii_val] = chr(155 - ascii_val)
+                elif 97 <= ascii_val <= 122:
+                    mapping[ascii_val] = chr(219 - ascii_val)
+            else:
+                mapping[ascii_val] = chr(126 - (ascii_val - 32))
+
+        return mapping
+
 
 class AffineCipher(metaclass=TextEncoder):
     """
@@ -200,13 +244,16 @@ class AffineCipher(metaclass=TextEncoder):
         key_a (int): The multiplicative key.
         key_b (int): The additive key.
         alpha_only (bool): Whether to encode only alphabetic characters.
+        validate (bool): Whether to check that the text only contains printable ASCII characters.
+        cache_size (int): The number of recent texts whose results are cached. 0 disables caching.
 
     Methods:
         encode(text): Encodes the given text using the Affine Cipher.
         decode(text): Decodes the given text using the Affine Cipher.
     """
 
-    def __init__(self, key_a: int = 3, key_b: int = 3, alpha_only: bool = False):
+    def __init__(self, key_a: int = 3, key_b: int = 3, alpha_only: bool = False, validate: bool = True,
+                 cache_size: int = 0):
         """
         Initializes the AffineCipher with the specified keys and mode.
 
@@ -214,6 +261,8 @@ class AffineCipher(metaclass=TextEncoder):
             key_a (int): The multiplicative key. Default is 3.
             key_b (int): The additive key. Default is 3.
             alpha_only (bool): Whether to encode only alphabetic characters. Default is False.
+            validate (bool): Whether to check that the text only contains printable ASCII characters. Default is True.
+            cache_size (int): The number of recent texts whose results are cached. 0 disables caching. Default is 0.
 
         Raises:
             ValueError: If the keys are out of the valid range or not coprime with the modulus.
@@ -221,19 +270,14 @@ class AffineCipher(metaclass=TextEncoder):
         self.key_a = key_a
         self.key_b = key_b
         self.alpha_only = alpha_only
+        self.validate = validate
+        self.__table_params = None
+        self.__get_tables()
 
-        if not 0 <= self.key_a <= 26 and self.alpha_only:
-            raise ValueError(
-                f"'key_a' cannot have a value {self.key_a}. Value must be within the range: 0 <= 'key_a' <= 26.")
-
-        if not 0 <= self.key_a <= 127 and not self.alpha_only:
-            raise ValueError(
-                f"'key_a' cannot have a value {self.key_a}. Value must be within the range: 0 <= 'key_a' <= 127.")
-
-        if not self.__coprime():
-            raise ValueError(f"'key_a' cannot have a value {self.key_a}. Value must be coprime with",
-                             "26" if self.alpha_only else "128")
+        _check_cache_size(cache_size)
+        self.cache_size = cache_size
 
+    @_cache_text_method('key_a', 'key_b', 'alpha_only', 'validate')
     def encode(self, text: str) -> str:
         """
         Encodes the given text using the Affine Cipher.
@@ -250,31 +294,12 @@ class AffineCipher(metaclass=TextEncoder):
         if not text:
             return text
 
-        if not any(32 <= ord(char) <= 126 for char in text):
-            raise ValueError("Text Encoders cannot handle characters with ASCII < 32 or ASCII > 127")
-
-        enc_text = ""
-
-        for i in text:
-            ascii_val = ord(i)
-            if 65 <= ascii_val <= 90:
-                x = ascii_val - 65 if self.alpha_only else ascii_val
-            elif 97 <= ascii_val <= 122:
-                x = ascii_val - 97 if self.alpha_only else ascii_val
-            else:
-                if self.alpha_only:
-                    enc_text += i
-                    continue
-                else:
-                    x = ascii_val
-            m = 26 if self.alpha_only else 95
-            rep_letter = chr(((self.key_a * (x - (0 if self.alpha_only else 32)) + self.key_b) % m) + (65 if self.alpha_only else 32))
-            if self.alpha_only:
-                rep_letter = rep_letter.lower() if chr(ascii_val).islower() else rep_letter.upper()
-            enc_text += rep_letter
+        if self.validate:
+            _validate_text(text)
 
-        return enc_text
+        return text.translate(self.__get_tables()[0])
 
+    @_cache_text_method('key_a', 'key_b', 'alpha_only', 'validate')
     def decode(self, text: str) -> str:
         """
         Decodes the given text using the Affine Cipher.
@@ -291,61 +316,75 @@ class AffineCipher(metaclass=TextEncoder):
         if not text:
             return text
 
-        if not any(32 <= ord(char) <= 126 for char in text):
-            raise ValueError("Text Encoders cannot handle characters with ASCII < 32 or ASCII > 127")
-        dec_text = ""
+        if self.validate:
+            _validate_text(text)
 
-        for i in text:
-            ascii_val = ord(i)
-            if 65 <= ascii_val <= 90:
-                x = ascii_val - 65 if self.alpha_only else ascii_val
-            elif 97 <= ascii_val <= 122:
-                x = ascii_val - 97 if self.alpha_only else ascii_val
-            else:
-                if self.alpha_only:
-                    dec_text += i
-                    continue
-                else:
-                    x = ascii_val
-
-            m = 26 if self.alpha_only else 95
-            key_inv = self.__mod_inverse(m)
-            if not key_inv:
-                raise ValueError("Unexpected error occurred.")
-            rep_letter = chr((key_inv * (x - (0 if self.alpha_only else 32) - self.key_b) % m) + (0 if self.alpha_only else 32))
-            if self.alpha_only:
-                rep_letter = chr((ord(rep_letter) + 65) if chr(ascii_val).isupper() else (ord(rep_letter) + 97))
-            dec_text += rep_letter
-
-        return dec_text
+        return text.translate(self.__get_tables()[1])
 
-    def __mod_inverse(self, m):
+    def __get_tables(self) -> tuple:
         """
-        Computes the modular inverse of key_a with respect to the modulus m.
-
-        Args:
-            m (int): The modulus.
+        Returns the encoding and decoding translation tables, checking the keys and rebuilding the tables if `key_a`,
+        `key_b` or `alpha_only` has changed since they were last built.
 
         Returns:
-            int: The modular inverse of key_a.
+            tuple: The encoding and decoding translation tables.
+
+        Raises:
+            ValueError: If the keys are out of the valid range or not coprime with the modulus.
         """
-        for i in range(1, m):
-            if (self.key_a * i) % m == 1:
-                return i
-        return None
+        params = (self.key_a, self.key_b, self.alpha_only)
+        if params == self.__table_params:
+            return self.__tables
+
+        if not 0 <= self.key_a <= 26 and self.alpha_only:
+            raise ValueError(
+                f"'key_a' cannot have a value {self.key_a}. Value must be within the range: 0 <= 'key_a' <= 26.")
+
+        if not 0 <= self.key_a <= 127 and not self.alpha_only:
+            raise ValueError(
+                f"'key_a' cannot have a value {self.key_a}. Value must be within the range: 0 <= 'key_a' <= 127.")
+
+        self.__modulus = 26 if self.alpha_only else 95
+
+        if math.gcd(self.key_a, self.__modulus) != 1:
+            raise ValueError(
+                f"'key_a' cannot have a value {self.key_a}. Value must be coprime with {self.__modulus}.")
 
-    def __coprime(self) -> bool:
+        self.__key_inv = pow(self.key_a, -1, self.__modulus)
+        self.__tables = (str.maketrans(self.__get_mapping(mode='encode')),
+                         str.maketrans(self.__get_mapping(mode='decode')))
+        self.__table_params = params
+
+        return self.__tables
+
+    def __get_mapping(self, mode: str) -> dict:
         """
-        Checks if key_a is coprime with the modulus.
+        Generates the character mapping of the Affine Cipher for the printable ASCII range.
+
+        Args:
+            mode (str): The mode of operation ('encode' or 'decode').
 
         Returns:
-            bool: True if key_a is coprime with the modulus, False otherwise.
+            dict: The mapping of each ASCII value to its replacement character.
         """
-        a = self.key_a
-        b = 26 if self.alpha_only else 95
-        while b != 0:
-            a, b = b, a % b
-        return a == 1
+        mapping = {}
+        for ascii_val in range(32, 127):
+            if not self.alpha_only:
+                base = 32
+            elif 65 <= ascii_val <= 90:
+                base = 65
+            elif 97 <= ascii_val <= 122:
+                base = 97
+            else:
+                continue
+
+            x = ascii_val - base
+            if mode == 'encode':
+                mapping[ascii_val] = chr((self.key_a * x + self.key_b) % self.__modulus + base)
+            else:
+                mapping[ascii_val] = chr(self.__key_inv * (x - self.key_b) % self.__modulus + base)
+
+        return mapping
 
 
 class VigenereCipher(metaclass=TextEncoder):
@@ -355,31 +394,40 @@ class VigenereCipher(metaclass=TextEncoder):
     Attributes:
         key (str): The key to use for the cipher.
         alpha_only (bool): Whether to encode only alphabetic characters.
-        final_key (str): The repeated key to match the length of the text.
+        validate (bool): Whether to check that the text only contains printable ASCII characters.
+        cache_size (int): The number of recent texts whose results are cached. 0 disables caching.
 
     Methods:
         encode(text): Encodes the given text using the Vigenere Cipher.
         decode(text): Decodes the given text using the Vigenere Cipher.
     """
 
-    def __init__(self, key: str = 'KEY', alpha_only: bool = False):
+    def __init__(self, key: str = 'KEY', alpha_only: bool = False, validate: bool = True, cache_size: int = 0):
         """
         Initializes the VigenereCipher with the specified key and mode.
 
         Args:
             key (str): The key to use for the cipher. Default is 'KEY'.
             alpha_only (bool): Whether to encode only alphabetic characters. Default is False.
+            validate (bool): Whether to check that the text only contains printable ASCII characters. Default is True.
+            cache_size (int): The number of recent texts whose results are cached. 0 disables caching. Default is 0.
 
         Raises:
             ValueError: If the key is empty.
         """
         self.key = key
         self.alpha_only = alpha_only
-        self.final_key = ""
+        self.validate = validate
 
         if self.key == "":
             raise ValueError("Key value cannot be null")
 
+        self.__key_params = None
+
+        _check_cache_size(cache_size)
+        self.cache_size = cache_size
+
+    @_cache_text_method('key', 'alpha_only', 'validate')
     def encode(self, text: str) -> str:
         """
         Encodes the given text using the Vigenere Cipher.
@@ -396,31 +444,12 @@ class VigenereCipher(metaclass=TextEncoder):
         if not text:
             return text
 
-        if not any(32 <= ord(char) <= 126 for char in text):
-            raise ValueError("Text Encoders cannot handle characters with ASCII < 32 or ASCII > 127")
+        if self.validate:
+            _validate_text(text)
 
-        self.final_key = (self.key * (len(text) // len(self.key) + 1)).upper()
-        enc_text = ""
-        if self.alpha_only:
-            matrix = self.__generate_matrix()
-
-        for i in range(len(text)):
-            if self.alpha_only:
-                if self.final_key[i].isalpha():
-                    if 65 <= ord(text[i]) <= 90:
-                        rep_letter = matrix[ord(text[i]) - 65][ord(self.final_key[i].upper()) - 65]
-                    elif 97 <= ord(text[i]) <= 122:
-                        rep_letter = matrix[ord(text[i]) - 97][ord(self.final_key[i].lower()) - 97]
-                        rep_letter = rep_letter.lower()
-                    else:
-                        rep_letter = text[i]
-                else:
-                    raise ValueError("Key must be composed of alphabets in Alphabet Only mode")
-            else:
-                rep_letter = chr((((ord(text[i]) - 32) + (ord(self.final_key[i]) - 32)) % 95) + 32)
-            enc_text += rep_letter
-        return enc_text
+        return self.__shift(text, direction=1)
 
+    @_cache_text_method('key', 'alpha_only', 'validate')
     def decode(self, text: str) -> str:
         """
         Decodes the given text using the Vigenere Cipher.
@@ -437,52 +466,60 @@ class VigenereCipher(metaclass=TextEncoder):
         if not text:
             return text
 
-        if not any(32 <= ord(char) <= 126 for char in text):
-            raise ValueError("Text Encoders cannot handle characters with ASCII < 32 or ASCII > 127")
+        if self.validate:
+            _validate_text(text)
 
-        self.final_key = (self.key * (len(text) // len(self.key) + 1)).upper()
-        dec_text = ""
-        if self.alpha_only:
-            matrix = self.__generate_matrix()
+        return self.__shift(text, direction=-1)
 
-        for i in range(len(text)):
-            if self.alpha_only:
-                index = np.where(matrix[0] == self.final_key[i])
-                letter = text[i].upper() if self.alpha_only else text[i]
-
-                if not self.final_key[i].isalpha():
-                    raise ValueError("Key must be composed of alphabets in Alphabet Only mode")
-
-                for j in range(len(matrix)):
-                    if matrix[j][index] == letter:
-                        break
-
-                if 65 <= ord(text[i]) <= 90:
-                    rep_letter = matrix[j][0]
-                elif 97 <= ord(text[i]) <= 122:
-                    rep_letter = matrix[j][0]
-                    rep_letter = rep_letter.lower()
-                else:
-                    rep_letter = text[i]
-            else:
-                rep_letter = chr((((ord(text[i]) - 32) - (ord(self.final_key[i]) - 32)) % 95) + 32)
+    def __get_key_shifts(self) -> np.ndarray:
+        """
+        Returns the shift of every key character, recomputing them if `key` or `alpha_only` has changed since they were
+        last computed.
 
-            dec_text += rep_letter
-        return dec_text
+        Returns:
+            ndarray: The shift of every key character.
+        """
+        params = (self.key, self.alpha_only)
+        if params != self.__key_params:
+            key_codes = np.array([ord(char) for char in self.key.upper()], dtype=np.int32)
+            self.__key_shifts = key_codes - (65 if self.alpha_only else 32)
+            self.__key_params = params
 
-    def __generate_matrix(self):
+        return self.__key_shifts
+
+    def __shift(self, text: str, direction: int) -> str:
         """
-        Generates the Vigenere matrix for alphabetic encoding.
+        Shifts every character of the text by the matching key character in a single vectorized pass.
+
+        Args:
+            text (str): The text to be shifted.
+            direction (int): 1 to add the key shifts (encoding), -1 to subtract them (decoding).
 
         Returns:
-            ndarray: The Vigenere matrix.
+            str: The shifted text.
+
+        Raises:
+            ValueError: If the key contains non-alphabetic characters in Alphabet Only mode.
         """
-        elements = np.array([chr(i) for i in range(65, 91)], dtype='<U1')
-        matrix = np.empty((26, 26), dtype='<U1')
+        try:
+            codec = 'latin-1'
+            arr = np.frombuffer(text.encode(codec), dtype=np.uint8).astype(np.int32)
+        except UnicodeEncodeError:
+            # Characters above U+00FF can only reach this point with validation disabled and need four bytes each
+            codec = 'utf-32-le'
+            arr = np.frombuffer(text.encode(codec), dtype=np.uint32).astype(np.int32)
+        key_shifts = np.resize(self.__get_key_shifts(), len(arr))
 
-        for i in range(len(elements)):
-            matrix[i] = np.roll(elements, -i)
+        if self.alpha_only and not np.all((key_shifts >= 0) & (key_shifts < 26)):
+            raise ValueError("Key must be composed of alphabets in Alphabet Only mode")
 
-        return matrix
+        shift = direction * key_shifts
 
+        if self.alpha_only:
+            upper = (arr >= 65) & (arr <= 90)
+            lower = (arr >= 97) & (arr <= 122)
+            out = np.where(upper, (arr - 65 + shift) % 26 + 65, np.where(lower, (arr - 97 + shift) % 26 + 97, arr))
+        else:
+            out = (arr - 32 + shift) % 95 + 32
 
+        return out.astype(np.uint8 if codec == 'latin-1' else np.uint32).tobytes().decode(codec)
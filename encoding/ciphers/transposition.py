@@ -11,11 +11,53 @@ Classes:
 
 """
 
+import functools
 import numpy as np
 import math
 import warnings
 
-from encoding.utils import TextEncoder
+from encoding.utils import TextEncoder, _validate_text, _check_cache_size, _cache_text_method
+
+
+def _to_array(text: str) -> tuple:
+    """
+    Converts a text into an array of its character codes, using one byte per character for ASCII text and four bytes
+    per character otherwise.
+
+    Args:
+        text (str): The text to be converted.
+
+    Returns:
+        tuple: The array of character codes and the codec needed to convert it back into text.
+    """
+    codec = 'ascii' if text.isascii() else 'utf-32-le'
+    return np.frombuffer(text.encode(codec), dtype=np.uint8 if codec == 'ascii' else np.uint32), codec
+
+
+@functools.lru_cache(maxsize=8)
+def _rail_order(length: int, rails: int) -> np.ndarray:
+    """
+    Generates the order in which the positions of a text are read off the rails.
+
+    Each position is assigned the rail the zig-zag pattern places it on, and the positions are then stably sorted by
+    rail, which gives the positions of the first rail from left to right followed by those of the next rail, and so on.
+    The most recently used orders are cached, since texts of the same length share the same order.
+
+    Args:
+        length (int): The length of the text.
+        rails (int): The number of rails.
+
+    Returns:
+        ndarray: The read-only positions of the text in the order they appear in the encoded text.
+    """
+    period = 2 * (rails - 1)
+    phase = np.arange(length) % period
+    rail = np.minimum(phase, period - phase)
+
+    order = np.argsort(rail, kind='stable')
+    order.flags.writeable = False
+
+    return order
 
 
 class RailFenceCipher(metaclass=TextEncoder):
@@ -24,29 +66,36 @@ class RailFenceCipher(metaclass=TextEncoder):
 
     Attributes:
         rails (int): The number of rails to use in the cipher.
-        rf_arr (ndarray): The array used to store the zig-zag pattern of characters.
+        validate (bool): Whether to check that the text only contains printable ASCII characters.
+        cache_size (int): The number of recent texts whose results are cached. 0 disables caching.
 
     Methods:
         encode(text): Encodes the given text using the Rail Fence Cipher.
         decode(text): Decodes the given text using the Rail Fence Cipher.
     """
 
-    def __init__(self, rails: int = 3):
+    def __init__(self, rails: int = 3, validate: bool = True, cache_size: int = 0):
         """
         Initializes the RailFenceCipher with the specified number of rails.
 
         Args:
             rails (int): The number of rails to use in the cipher. Default is 3.
+            validate (bool): Whether to check that the text only contains printable ASCII characters. Default is True.
+            cache_size (int): The number of recent texts whose results are cached. 0 disables caching. Default is 0.
 
         Raises:
             ValueError: If the number of rails is less than 2.
         """
         self.rails = rails
-        self.rf_arr = None
+        self.validate = validate
 
         if self.rails < 2:
             raise ValueError("The key in Rail Fence Cipher cannot be less than 2")
 
+        _check_cache_size(cache_size)
+        self.cache_size = cache_size
+
+    @_cache_text_method('rails', 'validate')
     def encode(self, text: str) -> str:
         """
         Encodes the given text using the Rail Fence Cipher.
@@ -63,19 +112,14 @@ class RailFenceCipher(metaclass=TextEncoder):
         if not text:
             return text
 
-        if not any(32 <= ord(char) <= 126 for char in text):
-            raise ValueError("Text Encoders cannot handle characters with ASCII < 32 or ASCII > 127")
-        self.rf_arr = np.zeros((self.rails, len(text)), dtype='str')
-        enc_text = ''
+        if self.validate:
+            _validate_text(text)
 
-        self.__zig_zag(mode='fill', text=text)
+        chars, codec = _to_array(text)
 
-        for i in range(len(self.rf_arr)):
-            for j in range(len(self.rf_arr[0])):
-                enc_text += self.rf_arr[i][j]
-
-        return enc_text
+        return chars[_rail_order(len(text), self.rails)].tobytes().decode(codec)
 
+    @_cache_text_method('rails', 'validate')
     def decode(self, text: str) -> str:
         """
         Decodes the given text using the Rail Fence Cipher.
@@ -92,68 +136,14 @@ class RailFenceCipher(metaclass=TextEncoder):
         if not text:
             return text
 
-        if not any(32 <= ord(char) <= 126 for char in text):
-            raise ValueError("Text Encoders cannot handle characters with ASCII < 32 or ASCII > 127")
-
-        self.rf_arr = np.zeros((self.rails, len(text)), dtype='str')
-        text_index = 0
+        if self.validate:
+            _validate_text(text)
 
-        self.__zig_zag(mode='fill', text='*' * len(text))
+        chars, codec = _to_array(text)
+        dec_chars = np.empty_like(chars)
+        dec_chars[_rail_order(len(text), self.rails)] = chars
 
-        for i in range(len(self.rf_arr)):
-            for j in range(len(self.rf_arr[0])):
-                if self.rf_arr[i][j] == '*':
-                    self.rf_arr[i][j] = text[text_index]
-                    text_index += 1
-
-        dec_text = self.__zig_zag(mode='get')
-
-        return dec_text
-
-    def __zig_zag(self, mode: str, text: str = ''):
-        """
-        Helper method to fill the zig-zag pattern in the rail fence array.
-
-        Args:
-            mode (str): The mode of operation ('fill' or 'get').
-            text (str): The text to fill in the zig-zag pattern.
-
-        Returns:
-            str: The text obtained from the zig-zag pattern if mode is 'get'.
-
-        Raises:
-            ValueError: If the mode is not 'fill' or 'get'.
-        """
-        i = j = 0
-        i_increasing = True
-
-        while True:
-            if i == self.rails - 1:
-                i_increasing = False
-            elif i == 0:
-                i_increasing = True
-
-            match mode:
-                case 'fill':
-                    if j >= len(text):
-                        break
-                    self.rf_arr[i][j] = text[j]
-                case 'get':
-                    text += self.rf_arr[i][j]
-                case _:
-                    raise ValueError("Mode cannot be anything other than 'fill' or 'get'.")
-
-            if i_increasing:
-                i += 1
-            else:
-                i -= 1
-            j += 1
-
-            if i >= len(self.rf_arr) or j >= len(self.rf_arr[0]):
-                break
-
-        if text:
-            return text
+        return dec_chars.tobytes().decode(codec)
 
 
 class ColumnarTranspositionCipher(metaclass=TextEncoder):
@@ -163,7 +153,8 @@ class ColumnarTranspositionCipher(metaclass=TextEncoder):
     Attributes:
         key (str): The key to use for the cipher.
         filler (str): The filler character to use for padding.
-        txt_arr (ndarray): The array used to store the characters in columnar order.
+        validate (bool): Whether to check that the text only contains printable ASCII characters.
+        cache_size (int): The number of recent texts whose results are cached. 0 disables caching.
         order_list (list): The order of columns based on the key.
 
     Methods:
@@ -171,13 +162,15 @@ class ColumnarTranspositionCipher(metaclass=TextEncoder):
         decode(text): Decodes the given text using the Columnar Transposition Cipher.
     """
 
-    def __init__(self, key: str = "key", filler: str = "_"):
+    def __init__(self, key: str = "key", filler: str = "_", validate: bool = True, cache_size: int = 0):
         """
         Initializes the ColumnarTranspositionCipher with the specified key and filler.
 
         Args:
             key (str): The key to use for the cipher. Default is "key".
             filler (str): The filler character to use for padding. Default is "_".
+            validate (bool): Whether to check that the text only contains printable ASCII characters. Default is True.
+            cache_size (int): The number of recent texts whose results are cached. 0 disables caching. Default is 0.
 
         Raises:
             ValueError: If the key is not unique.
@@ -188,9 +181,15 @@ class ColumnarTranspositionCipher(metaclass=TextEncoder):
         else:
             raise ValueError("The key for Columnar Transposition Cipher needs to be unique")
 
-        self.txt_arr = None
+        self.validate = validate
+
         self.order_list = self.__get_order_list(self.key)
+        self.__column_order = np.argsort(self.order_list)
+
+        _check_cache_size(cache_size)
+        self.cache_size = cache_size
 
+    @_cache_text_method('key', 'filler', 'validate')
     def encode(self, text: str) -> str:
         """
         Encodes the given text using the Columnar Transposition Cipher.
@@ -208,31 +207,25 @@ class ColumnarTranspositionCipher(metaclass=TextEncoder):
         if not text:
             return text
 
-        if not any(32 <= ord(char) <= 126 for char in text):
-            raise ValueError("Text Encoders cannot handle characters with ASCII < 32 or ASCII > 127")
+        if self.validate:
+            _validate_text(text)
 
         if self.filler in text:
             warnings.warn(f"Filler '{self.filler}' is present in the text which might lead to unwanted issues.")
 
-        self.txt_arr = np.zeros((math.ceil(len(text)/len(self.key)), len(self.key)), dtype='str')
-        text_index = 0
-        enc_text = ''
+        rows = math.ceil(len(text) / len(self.key))
+        padding = rows * len(self.key) - len(text)
+        chars, codec = _to_array(text + (self.filler[:1] or '\0') * padding)
+        enc_chars = chars.reshape(rows, len(self.key))[:, self.__column_order].T
 
-        for i in range(len(self.txt_arr)):
-            for j in range(len(self.txt_arr[0])):
-                if text_index < len(text):
-                    self.txt_arr[i][j] = text[text_index]
-                else:
-                    self.txt_arr[i][j] = self.filler
-                text_index += 1
+        if padding and not self.filler:
+            # An empty filler leaves the unfilled cells of the last row out of the encoded text
+            positions = np.arange(rows * len(self.key)).reshape(rows, len(self.key))[:, self.__column_order].T
+            enc_chars = enc_chars[positions < len(text)]
 
-        for i in range(len(self.order_list)):
-            for j in range(len(self.order_list)):
-                if self.order_list[j] == i:
-                    enc_text += ''.join(list(self.txt_arr[:, j].flatten()))
-
-        return enc_text
+        return enc_chars.tobytes().decode(codec)
 
+    @_cache_text_method('key', 'filler', 'validate')
     def decode(self, text: str) -> str:
         """
         Decodes the given text using the Columnar Transposition Cipher.
@@ -249,19 +242,14 @@ class ColumnarTranspositionCipher(metaclass=TextEncoder):
         if not text:
             return text
 
-        if not any(32 <= ord(char) <= 126 for char in text):
-            raise ValueError("Text Encoders cannot handle characters with ASCII < 32 or ASCII > 127")
-
-        rows = len(text)//len(self.key)
-        self.txt_arr = np.zeros((rows, len(self.key)), dtype='str')
+        if self.validate:
+            _validate_text(text)
 
-        for i in range(len(self.order_list)):
-            for j in range(rows):
-                self.txt_arr[j][i] = text[self.order_list[i] * rows + j]
+        rows = len(text) // len(self.key)
+        chars, codec = _to_array(text[:rows * len(self.key)])
+        dec_chars = chars.reshape(len(self.key), rows)[self.order_list].T
 
-        dec_text = ''.join(self.txt_arr.flatten()).rstrip(self.filler)
-
-        return dec_text
+        return dec_chars.tobytes().decode(codec).rstrip(self.filler)
 
     def __is_unique(self, text) -> bool:
         """
@@ -273,14 +261,11 @@ class ColumnarTranspositionCipher(metaclass=TextEncoder):
         Returns:
             bool: True if all characters are unique, False otherwise.
         """
-        for i in range(len(text) - 1):
-            if text[i] in text[i+1:]:
-                return False
-        return True
+        return len(set(text)) == len(text)
 
     def __get_order_list(self, text: str) -> list:
         """
-        Generates the order list based on the key.
+        Generates the order list based on the key, which is the rank of every key character in ASCII order.
 
         Args:
             text (str): The key to generate the order list from.
@@ -288,12 +273,8 @@ class ColumnarTranspositionCipher(metaclass=TextEncoder):
         Returns:
             list: The order list based on the key.
         """
-        lst = [ord(i) for i in text]
-        order = 0
-        for i in range(65, 91):
-            for j in range(len(lst)):
-                if lst[j] == i:
-                    lst[j] = order
-                    order += 1
-
-        return lst
+        codes = np.array([ord(char) for char in text])
+        ranks = np.empty(len(codes), dtype=np.intp)
+        ranks[np.argsort(codes, kind='stable')] = np.arange(len(codes))
+
+        return ranks.tolist()
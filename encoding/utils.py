@@ -14,9 +14,119 @@ Classes:
 
 """
 
+import ast
+import collections
+import concurrent.futures
+import functools
 import inspect
+import itertools
+import os
 import random
 import json
+import shutil
+import tempfile
+
+_PRINTABLE_ASCII = bytes(range(32, 127))
+_SALT_CHARACTERS = tuple(chr(i) for i in range(33, 127) if chr(i) not in '-\'"')
+
+
+def _validate_text(text: str) -> None:
+    """
+    Checks that the text only contains printable ASCII characters (32 <= ASCII <= 126).
+
+    ASCII text is checked by deleting every printable byte with `bytes.translate`, which runs in a single C-level pass;
+    anything left over is a control character.
+
+    Args:
+        text (str): The text to be checked.
+
+    Raises:
+        ValueError: If the text contains characters with ASCII < 32 or ASCII > 127.
+    """
+    if not text.isascii() or text.encode('ascii').translate(None, _PRINTABLE_ASCII):
+        raise ValueError("Text Encoders cannot handle characters with ASCII < 32 or ASCII > 127")
+
+
+def _check_cache_size(cache_size: int) -> None:
+    """
+    Checks that a cache size is not negative.
+
+    Args:
+        cache_size (int): The cache size to be checked.
+
+    Raises:
+        ValueError: If the cache size is negative.
+    """
+    if cache_size < 0:
+        raise ValueError("'cache_size' cannot be negative")
+
+
+def _cache_text_method(*param_names: str):
+    """
+    Decorates the `encode` or `decode` method of an encoder with a bounded LRU cache of the last `cache_size` texts.
+
+    The cache belongs to the instance and is keyed on the text together with the current values of the named
+    attributes, so reassigning any of them never returns a result computed with their old values. The size is read on
+    every call, so reassigning `cache_size` takes effect immediately and 0 disables the cache.
+
+    Args:
+        *param_names (str): The attributes of the encoder that the result of the method depends on.
+
+    Returns:
+        callable: The decorator.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, text: str) -> str:
+            if self.cache_size <= 0:
+                return method(self, text)
+
+            cache = self.__dict__.setdefault('_text_cache', {}).setdefault(method.__name__, collections.OrderedDict())
+            key = (tuple(getattr(self, name) for name in param_names), text)
+            if key in cache:
+                cache.move_to_end(key)
+                return cache[key]
+
+            result = cache[key] = method(self, text)
+            while len(cache) > self.cache_size:
+                cache.popitem(last=False)
+
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+_worker_encoder = None
+
+
+def _set_worker_encoder(encoder) -> None:
+    """
+    Stores the encoder used by the worker processes of a `TextFileEncoder`.
+
+    Args:
+        encoder (object): The encoder object to be used for encoding and decoding.
+    """
+    global _worker_encoder
+    _worker_encoder = encoder
+
+
+def _transform_lines(method: str, lines: list) -> list:
+    """
+    Encodes or decodes a batch of lines with the encoder of the current worker process.
+
+    Args:
+        method (str): The method to apply to the lines, 'encode' or 'decode'.
+        lines (list): The lines to be transformed.
+
+    Returns:
+        list: The transformed lines.
+    """
+    batch_func = getattr(_worker_encoder, method + '_batch', None)
+    if batch_func is not None:
+        return batch_func(lines)
+    return list(map(getattr(_worker_encoder, method), lines))
 
 
 class TextEncoder(type):
@@ -50,26 +160,54 @@ class TextEncoder(type):
 
         check_methods = ['encode', 'decode']
         for method in check_methods:
-            signature = inspect.signature(dct[method])
-            expected_params = ['self', 'text']
-            params = list(signature.parameters.keys())
-            if expected_params != params or signature.return_annotation != str:
+            if not cls.__has_text_signature(dct[method]):
                 raise TypeError(f"Method '{method}' must take 'self' and 'text' parameters and return a string")
 
         return super().__new__(cls, name, bases, dct)
 
+    @staticmethod
+    def __has_text_signature(func) -> bool:
+        """
+        Checks whether a method takes exactly `self` and `text` as parameters and is annotated to return a string.
+
+        Plain functions are checked through their code object, which avoids building an `inspect.Signature`. Other
+        callables and wrapped functions fall back to `inspect.signature`.
+
+        Args:
+            func (callable): The method to be checked.
+
+        Returns:
+            bool: True if the signature is valid, False otherwise.
+        """
+        code = getattr(func, '__code__', None)
+        if code is None or hasattr(func, '__wrapped__'):
+            signature = inspect.signature(func)
+            return list(signature.parameters.keys()) == ['self', 'text'] and signature.return_annotation == str
+
+        if code.co_kwonlyargcount or code.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS):
+            return False
+
+        return code.co_varnames[:code.co_argcount] == ('self', 'text') and func.__annotations__.get('return') == str
+
 
 class Pipeline:
     """
     A class for managing a sequence of encoders and applying them to text.
 
+    The ciphers in this package map printable ASCII text to printable ASCII text, so when encoding only the first
+    encoder of a pipeline needs to validate its input and the others can be created with `validate=False`. Text passed
+    to `decode` is then only checked by the encoders that still validate.
+
     Attributes:
-        encoders (list): A list of encoder classes and their names.
+        encoders (list): A list of encoder classes and their names. It should only be changed through `add_encoders` and
+            `remove_encoders`, which keep the sequence used by the encode and decode methods up to date.
         encoder_names (list): A list of encoder names.
 
     Methods:
         encode(text): Encodes the given text using the sequence of encoders.
         decode(text): Decodes the given text using the sequence of decoders.
+        encode_batch(texts): Encodes several texts using the sequence of encoders.
+        decode_batch(texts): Decodes several texts using the sequence of decoders.
         add_encoders(encoders): Adds more encoders to the sequence.
         remove_encoders(encoder_names): Removes encoders from the sequence by their names.
     """
@@ -102,8 +240,8 @@ class Pipeline:
         Returns:
             str: The encoded text.
         """
-        for encoder in self.encoders:
-            text = encoder[0].encode(text)
+        for encode in self.__encode_chain:
+            text = encode(text)
 
         return text
 
@@ -117,11 +255,51 @@ class Pipeline:
         Returns:
             str: The decoded text.
         """
-        for decoder in self.encoders[::-1]:
-            text = decoder[0].decode(text)
+        for decode in self.__decode_chain:
+            text = decode(text)
 
         return text
 
+    def encode_batch(self, texts: list) -> list:
+        """
+        Encodes several texts using the sequence of encoders.
+
+        Each encoder is applied to all the texts before the next one, through its own `encode_batch` method if it has
+        one.
+
+        Args:
+            texts (list): The texts to be encoded.
+
+        Returns:
+            list: The encoded texts.
+        """
+        texts = list(texts)
+        for encoder in self.__stages:
+            encode_batch = getattr(encoder, 'encode_batch', None)
+            texts = encode_batch(texts) if encode_batch else list(map(encoder.encode, texts))
+
+        return texts
+
+    def decode_batch(self, texts: list) -> list:
+        """
+        Decodes several texts using the sequence of decoders.
+
+        Each decoder is applied to all the texts before the next one, through its own `decode_batch` method if it has
+        one.
+
+        Args:
+            texts (list): The texts to be decoded.
+
+        Returns:
+            list: The decoded texts.
+        """
+        texts = list(texts)
+        for decoder in reversed(self.__stages):
+            decode_batch = getattr(decoder, 'decode_batch', None)
+            texts = decode_batch(texts) if decode_batch else list(map(decoder.decode, texts))
+
+        return texts
+
     def add_encoders(self, encoders: list):
         """
         Adds more encoders to the sequence.
@@ -151,15 +329,11 @@ class Pipeline:
         for encoder_name in encoder_names:
             if type(encoder_name) != str:
                 raise ValueError("Encoders must be passed as a list of encoder names.")
-            if encoder_name not in self.encoder_names:
+            if encoder_name not in self.__encoder_name_set:
                 raise ValueError("Encoder names given are unavailable in original list of encoders.")
 
-        temp_encoders = []
-        for encoder in self.encoders:
-            if encoder[1] not in encoder_names:
-                temp_encoders.append(encoder)
-
-        self.encoders = temp_encoders
+        remove_set = set(encoder_names)
+        self.encoders = [encoder for encoder in self.encoders if encoder[1] not in remove_set]
         self.__get_encoder_names()
 
     def __is_valid(self, encoders) -> bool:
@@ -179,17 +353,33 @@ class Pipeline:
             if type(encoder[1]) != str:
                 return False
 
+            if not callable(getattr(encoder[0], 'encode', None)) or not callable(getattr(encoder[0], 'decode', None)):
+                return False
+
         return True
 
     def __get_encoder_names(self):
         """
-        Updates the list of encoder names.
+        Updates the list and set of encoder names, along with the sequence of encoder objects and the chains of their
+        bound encode and decode methods.
+
+        Raises:
+            ValueError: If two encoders have the same name.
         """
-        self.encoder_names.clear()
+        encoder_names = []
+        encoder_name_set = set()
         for encoder in self.encoders:
-            if encoder in self.encoder_names:
-                raise ValueError(f"Two encoders cannot have the same name: {encoder}.")
-            self.encoder_names.append(encoder[1])
+            if encoder[1] in encoder_name_set:
+                raise ValueError(f"Two encoders cannot have the same name: {encoder[1]}.")
+            encoder_names.append(encoder[1])
+            encoder_name_set.add(encoder[1])
+
+        self.encoder_names.clear()
+        self.encoder_names.extend(encoder_names)
+        self.__encoder_name_set = encoder_name_set
+        self.__stages = tuple(encoder[0] for encoder in self.encoders)
+        self.__encode_chain = tuple(stage.encode for stage in self.__stages)
+        self.__decode_chain = tuple(stage.decode for stage in reversed(self.__stages))
 
 
 class Salt:
@@ -202,13 +392,15 @@ class Salt:
         characters (list): The list of characters to use for salting.
         min_length (int): The minimum length of the salt.
         max_length (int): The maximum length of the salt.
+        cache_size (int): The number of salts kept for reuse between calls. 0 disables caching.
 
     Methods:
         encode(text): Adds salt to the text.
         decode(text): Removes salt from the text.
     """
 
-    def __init__(self, position: str = 'between', random_seed: int = 42, min_length: int = 2, max_length: int = 7):
+    def __init__(self, position: str = 'between', random_seed: int = 42, min_length: int = 2, max_length: int = 7,
+                 cache_size: int = 1024):
         """
         Initializes the Salt class with the given parameters.
 
@@ -217,13 +409,14 @@ class Salt:
             random_seed (int): The seed for the random number generator.
             min_length (int): The minimum length of the salt.
             max_length (int): The maximum length of the salt.
+            cache_size (int): The number of salts kept for reuse between calls. Salts beyond this count are generated
+                again on every call. 0 disables caching. Default is 1024.
 
         Raises:
-            ValueError: If the position is not 'front', 'end', or 'between'.
+            ValueError: If the position is not 'front', 'end', or 'between', or if the cache size is negative.
         """
-        random.seed(random_seed)
-        self.random_state = random.getstate()
-        self.characters = [chr(i) for i in range(33, 127) if chr(i) not in ['-', '\'', '\"']]
+        self.random_state = random.Random(random_seed).getstate()
+        self.characters = list(_SALT_CHARACTERS)
         self.min_length = min_length
         self.max_length = max_length
         self.positions = ['front', 'end', 'between']
@@ -233,6 +426,12 @@ class Salt:
         else:
             raise ValueError(f"Salt position cannot be '{position}'. Valid salt positons: {', '.join(self.positions)}")
 
+        _check_cache_size(cache_size)
+        self.cache_size = cache_size
+
+        self.__salts = []
+        self.__salt_params = None
+
     def encode(self, text: str) -> str:
         """
         Adds salt to the text.
@@ -243,19 +442,15 @@ class Salt:
         Returns:
             str: The salted text.
         """
-        random.setstate(self.random_state)
         match self.position:
             case 'front':
-                return self.__get_salt() + text
+                return next(self.__iter_salts()) + text
 
             case 'end':
-                return text + self.__get_salt()
+                return text + next(self.__iter_salts())
 
             case 'between':
-                salts = []
-                for i in range(len(text)):
-                    salts.append(self.__get_salt())
-                return ''.join([text[i] + salts[i] for i in range(len(salts))])
+                return ''.join([char + salt for char, salt in zip(text, self.__iter_salts())])
 
     def decode(self, text: str) -> str:
         """
@@ -267,32 +462,62 @@ class Salt:
         Returns:
             str: The desalted text.
         """
-        random.setstate(self.random_state)
         match self.position:
             case 'front':
-                return text.removeprefix(self.__get_salt())
+                return text.removeprefix(next(self.__iter_salts()))
 
             case 'end':
-                return text.removesuffix(self.__get_salt())
+                return text.removesuffix(next(self.__iter_salts()))
 
             case 'between':
-                pure_text = ''
-                try:
-                    i = 0
-                    while True:
-                        pure_text += text[i]
-                        i += len(self.__get_salt()) + 1
-                except IndexError:
-                    return pure_text
+                salts = self.__iter_salts()
+                pure_text = []
+                i = 0
+                while i < len(text):
+                    pure_text.append(text[i])
+                    i += len(next(salts)) + 1
+                return ''.join(pure_text)
+
+    def __iter_salts(self):
+        """
+        Yields the salts of the random sequence in order.
+
+        The salts are drawn from a generator restored to `random_state`, so the sequence is the same on every call. The
+        first `cache_size` salts are kept and reused by later calls, and the rest are generated again from a copy of the
+        generator. The cache is cleared if `random_state`, `characters`, `min_length` or `max_length` has changed.
 
-    def __get_salt(self) -> str:
+        Yields:
+            str: The next salt.
         """
-        Generates a random string of characters to be used as salt.
+        params = (self.random_state, tuple(self.characters), self.min_length, self.max_length)
+        if params != self.__salt_params:
+            self.__rng = random.Random()
+            self.__rng.setstate(self.random_state)
+            self.__salts = []
+            self.__salt_params = params
+
+        yield from self.__salts
+
+        while len(self.__salts) < self.cache_size:
+            self.__salts.append(self.__new_salt(self.__rng))
+            yield self.__salts[-1]
+
+        rng = random.Random()
+        rng.setstate(self.__rng.getstate())
+        while True:
+            yield self.__new_salt(rng)
+
+    def __new_salt(self, rng: random.Random) -> str:
+        """
+        Generates a salt with the given random number generator.
+
+        Args:
+            rng (random.Random): The random number generator.
 
         Returns:
             str: The generated salt.
         """
-        return ''.join(random.choices(self.characters, k=random.randint(self.min_length, self.max_length)))
+        return ''.join(rng.choices(self.characters, k=rng.randint(self.min_length, self.max_length)))
 
 
 class StructuredDataEncoder:
@@ -301,20 +526,32 @@ class StructuredDataEncoder:
 
     Attributes:
         encoder (object): The encoder object to be used for encoding and decoding.
+        cache_size (int): The number of recent leaf values whose encoded or decoded text is cached within each call. 0
+            disables caching.
 
     Methods:
         encode(data): Encodes the given structured data.
         decode(data): Decodes the given structured data.
     """
 
-    def __init__(self, encoder: object):
+    def __init__(self, encoder: object, cache_size: int = 0):
         """
         Initializes the StructuredDataEncoder with the given encoder.
 
         Args:
             encoder (object): The encoder object to be used for encoding and decoding.
+            cache_size (int): The number of recent leaf values whose encoded or decoded text is cached within each
+                call. Repeated leaves, such as keys and enumerated values, are then only passed to the encoder once per
+                call. 0 disables caching. Default is 0.
+
+        Raises:
+            ValueError: If the cache size is negative.
         """
+        _check_cache_size(cache_size)
+
         self.encoder = encoder
+        self.cache_size = cache_size
+        self.__containers = {container: container for container in (list, tuple, dict, set, frozenset)}
 
     def encode(self, data: object) -> object:
         """
@@ -326,18 +563,8 @@ class StructuredDataEncoder:
         Returns:
             object: The encoded data.
         """
-        if isinstance(data, list):
-            return self.__list_encoder(data, mode='encode')
-        elif isinstance(data, tuple):
-            return self.__tuple_encoder(data, mode='encode')
-        elif isinstance(data, dict):
-            return self.__dict_encoder(data, mode='encode')
-        elif isinstance(data, set):
-            return self.__set_encoder(data, mode='encode')
-        elif isinstance(data, frozenset):
-            return self.__frozen_set_encoder(data, mode='encode')
-        else:
-            return self.encoder.encode(self.__get_str(data))
+        encode_text = self.__get_text_method(self.encoder.encode)
+        return self.__transform(data, functools.partial(self.__encode_leaf, encode_text=encode_text))
 
     def decode(self, data: object) -> object:
         """
@@ -352,106 +579,188 @@ class StructuredDataEncoder:
         Raises:
             ValueError: If the data type is not supported.
         """
-        if isinstance(data, list):
-            return self.__list_encoder(data, mode='decode')
-        elif isinstance(data, tuple):
-            return self.__tuple_encoder(data, mode='decode')
-        elif isinstance(data, dict):
-            return self.__dict_encoder(data, mode='decode')
-        elif isinstance(data, set):
-            return self.__set_encoder(data, mode='decode')
-        elif isinstance(data, frozenset):
-            return self.__frozen_set_encoder(data, mode='decode')
-        elif isinstance(data, str):
-            return eval(self.encoder.decode(data))
-        else:
-            raise ValueError(f"Data type '{data}' is not supported.")
+        decode_text = self.__get_text_method(self.encoder.decode)
+        return self.__transform(data, functools.partial(self.__decode_leaf, decode_text=decode_text))
 
-    def __list_encoder(self, data: list, mode: str = 'encode') -> list:
+    def __transform(self, data: object, transform_leaf) -> object:
         """
-        Encodes or decodes a list.
+        Rebuilds the given data with every leaf value transformed by the given function.
+
+        The data is walked with an explicit stack instead of recursion, so deeply nested data does not hit the recursion
+        limit. Each stack frame holds a container type, an iterator over its children and the transformed children so
+        far; once the iterator is exhausted, the container is built from the transformed children and added to its
+        parent's.
 
         Args:
-            data (list): The list to be encoded or decoded.
-            mode (str): The mode of operation ('encode' or 'decode').
+            data (object): The data to be transformed.
+            transform_leaf (callable): The function applied to each leaf value.
 
         Returns:
-            list: The encoded or decoded list.
-        """
-        new_list = []
-        for index, datum in enumerate(data):
-            if mode == 'encode':
-                new_list.append(self.encode(datum))
+            object: The transformed data.
+        """
+        root = []
+        stack = [(None, iter((data,)), root)]
+
+        while stack:
+            container, children, results = stack[-1]
+            for child in children:
+                child_container = self.__get_container(child)
+                if child_container:
+                    stack.append((child_container, self.__get_children(child, child_container), []))
+                    break
+                results.append(transform_leaf(child))
             else:
-                new_list.append(self.decode(datum))
+                stack.pop()
+                if stack:
+                    stack[-1][2].append(self.__build(container, results))
 
-        return new_list
+        return root[0]
 
-    def __tuple_encoder(self, data: tuple, mode: str = 'encode') -> tuple:
+    def __get_container(self, data: object) -> type:
         """
-        Encodes or decodes a tuple.
+        Returns the container type the given data is handled as, or None if it is a leaf value.
+
+        The container is looked up by the exact type of the data. Types seen for the first time are matched with
+        `isinstance` so that subclasses of the containers are handled too, and the result is remembered for that type.
 
         Args:
-            data (tuple): The tuple to be encoded or decoded.
-            mode (str): The mode of operation ('encode' or 'decode').
+            data (object): The data to be checked.
 
         Returns:
-            tuple: The encoded or decoded tuple.
+            type: The container type (list, tuple, dict, set or frozenset), or None if the data is not a container.
         """
-        return tuple(self.__list_encoder(list(data), mode=mode))
+        data_type = type(data)
+        if data_type not in self.__containers:
+            self.__containers[data_type] = next((container for container in (list, tuple, dict, set, frozenset)
+                                                 if isinstance(data, container)), None)
+
+        return self.__containers[data_type]
 
-    def __dict_encoder(self, data: dict, mode: str = 'encode') -> dict:
+    @staticmethod
+    def __get_children(data: object, container: type):
         """
-        Encodes or decodes a dictionary.
+        Returns an iterator over the children of a container. The keys and values of a dictionary are alternated.
 
         Args:
-            data (dict): The dictionary to be encoded or decoded.
-            mode (str): The mode of operation ('encode' or 'decode').
+            data (object): The container.
+            container (type): The container type the data is handled as.
 
         Returns:
-            dict: The encoded or decoded dictionary.
+            iterator: The children of the container.
         """
-        new_dict = {}
-        for key, value in data.items():
-            if mode == 'encode':
-                new_dict[self.encode(key)] = self.encode(value)
-            else:
-                new_dict[self.decode(key)] = self.decode(value)
+        if container is dict:
+            return itertools.chain.from_iterable(data.items())
+        return iter(data)
 
-        return new_dict
+    @staticmethod
+    def __build(container: type, results: list) -> object:
+        """
+        Builds a container from its transformed children.
 
-    def __set_encoder(self, data: set, mode: str = 'encode') -> set:
+        Args:
+            container (type): The container type to be built.
+            results (list): The transformed children, with keys and values alternated for a dictionary.
+
+        Returns:
+            object: The built container.
         """
-        Encodes or decodes a set.
+        if container is list:
+            return results
+        if container is dict:
+            return dict(zip(results[::2], results[1::2]))
+        return container(results)
+
+    def __encode_leaf(self, data: object, encode_text) -> str:
+        """
+        Encodes a leaf value through its string representation.
 
         Args:
-            data (set): The set to be encoded or decoded.
-            mode (str): The mode of operation ('encode' or 'decode').
+            data (object): The leaf value to be encoded.
+            encode_text (callable): The function encoding the string representation.
 
         Returns:
-            set: The encoded or decoded set.
+            str: The encoded leaf value.
+
+        Raises:
+            ValueError: If the data type is not supported.
         """
-        new_set = set({})
-        for element in data:
-            if mode == 'encode':
-                new_set.add(self.encode(element))
-            else:
-                new_set.add(self.decode(element))
+        return encode_text(self.__get_str(data))
+
+    def __decode_leaf(self, data: object, decode_text) -> object:
+        """
+        Decodes an encoded leaf value back into the original value.
+
+        Args:
+            data (object): The encoded leaf value.
+            decode_text (callable): The function decoding the encoded string representation.
+
+        Returns:
+            object: The decoded leaf value.
+
+        Raises:
+            ValueError: If the data type is not supported.
+        """
+        if not isinstance(data, str):
+            raise ValueError(f"Data type '{data}' is not supported.")
 
-        return new_set
+        return self.__parse_str(decode_text(data))
 
-    def __frozen_set_encoder(self, data: frozenset, mode: str = 'encode') -> frozenset:
+    def __get_text_method(self, method):
         """
-        Encodes or decodes a frozenset.
+        Returns the given method of the encoder wrapped in a new LRU cache of `cache_size` entries, or the method itself
+        if caching is disabled.
+
+        A new cache is made for every call to `encode` or `decode`, so cached text never outlives a change to the
+        parameters of the encoder and nothing is kept on the instance between calls.
 
         Args:
-            data (frozenset): The frozenset to be encoded or decoded.
-            mode (str): The mode of operation ('encode' or 'decode').
+            method (callable): The `encode` or `decode` method of the encoder.
 
         Returns:
-            frozenset: The encoded or decoded frozenset.
+            callable: The method used for the leaf values of one call.
         """
-        return frozenset(self.__set_encoder(set(data), mode=mode))
+        if self.cache_size > 0:
+            return functools.lru_cache(maxsize=self.cache_size)(method)
+        return method
+
+    @staticmethod
+    def __parse_str(text: str) -> object:
+        """
+        Converts a string representation produced by `__get_str` back into the object, without evaluating it as code.
+
+        Args:
+            text (str): The string representation of the object.
+
+        Returns:
+            object: The object represented by the string.
+
+        Raises:
+            ValueError: If the string does not represent a supported object.
+        """
+        if text.startswith("str('") and text.endswith("')"):
+            return text[5:-2]
+        if text in ('None', 'True', 'False'):
+            return {'None': None, 'True': True, 'False': False}[text]
+        if text.startswith('range(') and text.endswith(')'):
+            return range(*map(int, text[6:-1].split(',')))
+        if text.startswith('bytearray(') and text.endswith(')'):
+            return bytearray(ast.literal_eval(text[10:-1]))
+
+        for parse in (int, float):
+            try:
+                return parse(text)
+            except ValueError:
+                pass
+
+        try:
+            return ast.literal_eval(text)
+        except (ValueError, SyntaxError):
+            pass
+
+        try:
+            return complex(text)
+        except ValueError:
+            raise ValueError(f"'{text}' does not represent a supported data type.") from None
 
     def __get_str(self, obj: object) -> str:
         """
@@ -480,20 +789,31 @@ class TextFileEncoder:
 
     Attributes:
         encoder (object): The encoder object to be used for encoding and decoding.
+        buffer_size (int): The size in bytes of the read and write buffers of the files.
+        batch_size (int): The number of lines passed at once to encoders that support batches.
+        workers (int): The number of processes the lines are encoded or decoded in.
 
     Methods:
         encode(file, file_out): Encodes the content of a text file.
         decode(file, file_out): Decodes the content of a text file.
     """
 
-    def __init__(self, encoder: object):
+    def __init__(self, encoder: object, buffer_size: int = 1 << 20, batch_size: int = 1000, workers: int = 1):
         """
         Initializes the TextFileEncoder with the given encoder.
 
         Args:
             encoder (object): The encoder object to be used for encoding and decoding.
+            buffer_size (int): The size in bytes of the read and write buffers of the files. Default is 1 MiB.
+            batch_size (int): The number of lines passed at once to encoders that support batches, such as `Pipeline`.
+                Default is 1000.
+            workers (int): The number of processes the lines are encoded or decoded in. With more than 1, batches of
+                `batch_size` lines are spread over a process pool, so the encoder must be picklable. Default is 1.
         """
         self.encoder = encoder
+        self.buffer_size = buffer_size
+        self.batch_size = batch_size
+        self.workers = workers
 
     def encode(self, file: str, file_out: str = None) -> None:
         """
@@ -506,17 +826,10 @@ class TextFileEncoder:
         Raises:
             ValueError: If the file extensions are not '.txt'.
         """
-        if file[file.rindex('.') + 1:] != 'txt' or (file_out[file_out.rindex('.') + 1:] != 'txt' if file_out else False):
+        if not file.endswith('.txt') or (file_out and not file_out.endswith('.txt')):
             raise ValueError("TextFileEncoder only supports text files with extension: '.txt'")
 
-        enc_text = ''
-        with open(file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                enc_text += self.encoder.encode(line) + '\n'
-
-        with open(file_out if file_out else file, 'w') as f:
-            f.write(enc_text)
+        self.__transform(file, file_out, 'encode')
 
     def decode(self, file: str, file_out: str = None) -> None:
         """
@@ -529,17 +842,76 @@ class TextFileEncoder:
         Raises:
             ValueError: If the file extensions are not '.txt'.
         """
-        if file[file.rindex('.') + 1:] != 'txt' or (file_out[file_out.rindex('.') + 1:] != 'txt' if file_out else False):
+        if not file.endswith('.txt') or (file_out and not file_out.endswith('.txt')):
             raise ValueError("TextFileEncoder only supports text files with extension: '.txt'")
 
-        dec_text = ''
-        with open(file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                dec_text += self.encoder.decode(line) + '\n'
+        self.__transform(file, file_out, 'decode')
 
-        with open(file_out if file_out else file, 'w') as f:
-            f.write(dec_text)
+    def __transform(self, file: str, file_out: str, method: str) -> None:
+        """
+        Streams the input file line by line through the given method of the encoder into the output file.
+
+        When no output file is given, or the output file is the input file itself, the lines are written to a temporary
+        file in the same directory, which then replaces the input file, or the file it links to if it is a symbolic
+        link. Files are read and written as UTF-8 with buffers of `buffer_size` bytes.
+
+        Args:
+            file (str): The path to the input file.
+            file_out (str): The path to the output file. If None, the input file will be overwritten.
+            method (str): The method of the encoder applied to the lines, 'encode' or 'decode'.
+        """
+        # Opening the input file itself for writing would empty it before it is read
+        if file_out and not (os.path.exists(file_out) and os.path.samefile(file, file_out)):
+            with (open(file, 'r', encoding='utf-8', buffering=self.buffer_size) as f_in,
+                  open(file_out, 'w', encoding='utf-8', buffering=self.buffer_size) as f_out):
+                self.__write_lines(f_in, f_out, method)
+            return
+
+        # Replace the target of a symbolic link rather than the link itself
+        file = os.path.realpath(file)
+        fd, tmp_file = tempfile.mkstemp(suffix='.tmp', dir=os.path.dirname(file))
+        try:
+            with (os.fdopen(fd, 'w', encoding='utf-8', buffering=self.buffer_size) as f_out,
+                  open(file, 'r', encoding='utf-8', buffering=self.buffer_size) as f_in):
+                self.__write_lines(f_in, f_out, method)
+            shutil.copymode(file, tmp_file)
+            os.replace(tmp_file, file)
+        except BaseException:
+            os.remove(tmp_file)
+            raise
+
+    def __write_lines(self, f_in, f_out, method: str) -> None:
+        """
+        Writes each line of the input file, transformed by the given method of the encoder, to the output file.
+
+        Encoders with a batch variant of the method ('encode_batch' or 'decode_batch') are given `batch_size` lines at
+        a time. With more than one worker, the batches are transformed in a process pool, a few batches per worker at
+        a time so that memory stays bounded, and written in their original order.
+
+        Args:
+            f_in (TextIO): The input file object.
+            f_out (TextIO): The output file object.
+            method (str): The method of the encoder applied to the lines, 'encode' or 'decode'.
+        """
+        if self.workers > 1:
+            batches = iter(lambda: [line.rstrip('\n') for line in itertools.islice(f_in, self.batch_size)], [])
+            with concurrent.futures.ProcessPoolExecutor(max_workers=self.workers, initializer=_set_worker_encoder,
+                                                        initargs=(self.encoder,)) as pool:
+                while window := list(itertools.islice(batches, 2 * self.workers)):
+                    for lines in pool.map(_transform_lines, itertools.repeat(method, len(window)), window):
+                        f_out.writelines(line + '\n' for line in lines)
+            return
+
+        func = getattr(self.encoder, method)
+        batch_func = getattr(self.encoder, method + '_batch', None)
+        if batch_func is None:
+            for line in f_in:
+                f_out.write(func(line.rstrip('\n')))
+                f_out.write('\n')
+            return
+
+        while lines := [line.rstrip('\n') for line in itertools.islice(f_in, self.batch_size)]:
+            f_out.writelines(line + '\n' for line in batch_func(lines))
 
 
 class JSONFileEncoder:
@@ -575,7 +947,7 @@ class JSONFileEncoder:
         Raises:
             ValueError: If the file extensions are not '.json'.
         """
-        if file[file.rindex('.') + 1:] != 'json' or (file_out[file_out.rindex('.') + 1:] != 'json' if file_out else False):
+        if not file.endswith('.json') or (file_out and not file_out.endswith('.json')):
             raise ValueError("JSONFileEncoder only supports text files with extension: '.json'")
 
         with open(file, 'r') as f:
@@ -598,7 +970,7 @@ class JSONFileEncoder:
         Raises:
             ValueError: If the file extensions are not '.json'.
         """
-        if file[file.rindex('.') + 1:] != 'json' or (file_out[file_out.rindex('.') + 1:] != 'json' if file_out else False):
+        if not file.endswith('.json') or (file_out and not file_out.endswith('.json')):
             raise ValueError("JSONFileEncoder only supports text files with extension: '.json'")
 
         with open(file, 'r') as f:
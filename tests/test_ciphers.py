@@ -1,3 +1,4 @@
+import pickle
 import unittest
 
 from encoding.utils import TextEncoder, Pipeline, Salt, StructuredDataEncoder, TextFileEncoder, JSONFileEncoder
@@ -14,12 +15,25 @@ class CipherTestBase(unittest.TestCase):
         ""
     ]
 
+    invalid_strings = [
+        "Tab\tseparated",
+        "Caf\u00e9",
+        "Line\n"
+    ]
+
     def run_cipher_tests(self, encoder):
         for sample_string in self.sample_strings:
             enc_str = encoder.encode(sample_string)
             dec_str = encoder.decode(enc_str)
             self.assertEqual(sample_string, dec_str)
 
+    def run_validation_tests(self, encoder):
+        for invalid_string in self.invalid_strings:
+            with self.assertRaises(ValueError):
+                encoder.encode(invalid_string)
+            with self.assertRaises(ValueError):
+                encoder.decode(invalid_string)
+
 
 class TestCaesarCipher(CipherTestBase):
     def test_alpha_only_false(self):
@@ -30,6 +44,38 @@ class TestCaesarCipher(CipherTestBase):
         encoder = CaesarCipher(shift=5, alpha_only=True)
         self.run_cipher_tests(encoder)
 
+    def test_invalid_text(self):
+        encoder = CaesarCipher()
+        self.run_validation_tests(encoder)
+
+    def test_cache(self):
+        encoder = CaesarCipher(shift=5, cache_size=8)
+        self.run_cipher_tests(encoder)
+        self.run_cipher_tests(encoder)
+        self.assertEqual(pickle.loads(pickle.dumps(encoder)).encode("abc"), "fgh")
+
+    def test_cache_param_change(self):
+        encoder = CaesarCipher(shift=5, cache_size=8)
+        self.assertEqual(encoder.encode("abc"), "fgh")
+        encoder.shift = 1
+        self.assertEqual(encoder.encode("abc"), "bcd")
+        self.assertEqual(encoder.decode("bcd"), "abc")
+
+        encoder.cache_size = 0
+        encoder.shift = 2
+        self.assertEqual(encoder.encode("abc"), "cde")
+
+    def test_negative_cache_size(self):
+        with self.assertRaises(ValueError):
+            CaesarCipher(cache_size=-1)
+
+    def test_shift_change(self):
+        encoder = CaesarCipher(shift=5)
+        self.assertEqual(encoder.encode("abc"), "fgh")
+        encoder.shift = 1
+        self.assertEqual(encoder.encode("abc"), "bcd")
+        self.run_cipher_tests(encoder)
+
 
 class TestAtbashCipher(CipherTestBase):
     def test_alpha_only_false(self):
@@ -40,6 +86,16 @@ class TestAtbashCipher(CipherTestBase):
         encoder = AtbashCipher(alpha_only=True)
         self.run_cipher_tests(encoder)
 
+    def test_mode_change(self):
+        encoder = AtbashCipher(alpha_only=False)
+        self.assertEqual(encoder.encode("a!"), "=}")
+        encoder.alpha_only = True
+        self.assertEqual(encoder.encode("a!"), "z!")
+
+    def test_invalid_text(self):
+        encoder = AtbashCipher()
+        self.run_validation_tests(encoder)
+
 
 class TestAffineCipher(CipherTestBase):
     def test_alpha_only_false(self):
@@ -50,6 +106,20 @@ class TestAffineCipher(CipherTestBase):
         encoder = AffineCipher(alpha_only=True)
         self.run_cipher_tests(encoder)
 
+    def test_invalid_text(self):
+        encoder = AffineCipher()
+        self.run_validation_tests(encoder)
+
+    def test_key_change(self):
+        encoder = AffineCipher(key_a=3, key_b=3)
+        encoder.key_a, encoder.key_b = 7, 11
+        self.assertEqual(encoder.encode("abc"), AffineCipher(key_a=7, key_b=11).encode("abc"))
+        self.run_cipher_tests(encoder)
+
+        encoder.key_a = 5
+        with self.assertRaises(ValueError):
+            encoder.encode("abc")
+
 
 class TestVigenereCipher(CipherTestBase):
     def test_alpha_only_false(self):
@@ -60,6 +130,34 @@ class TestVigenereCipher(CipherTestBase):
         encoder = VigenereCipher(key="encoding", alpha_only=True)
         self.run_cipher_tests(encoder)
 
+    def test_invalid_text(self):
+        encoder = VigenereCipher()
+        self.run_validation_tests(encoder)
+
+    def test_non_alpha_key(self):
+        encoder = VigenereCipher(key="k3y", alpha_only=True)
+        with self.assertRaises(ValueError):
+            encoder.encode("Hello, World!")
+
+    def test_key_change(self):
+        encoder = VigenereCipher(key="KEY")
+        encoder.key = "encoding"
+        self.assertEqual(encoder.encode("Hello"), VigenereCipher(key="encoding").encode("Hello"))
+        self.run_cipher_tests(encoder)
+
+    def test_wide_text_without_validation(self):
+        encoder = VigenereCipher(key="encoding", alpha_only=True, validate=False)
+        self.assertEqual(encoder.decode(encoder.encode("Hello, \u4e16\u754c!")), "Hello, \u4e16\u754c!")
+
+        encoder = VigenereCipher(key="encoding", validate=False)
+        self.assertEqual(encoder.encode("Hello, \u4e16\u754c!")[:7], VigenereCipher(key="encoding").encode("Hello, "))
+
+    def test_cache_key_change(self):
+        encoder = VigenereCipher(key="KEY", cache_size=8)
+        encoder.encode("Hello")
+        encoder.key = "encoding"
+        self.assertEqual(encoder.encode("Hello"), VigenereCipher(key="encoding").encode("Hello"))
+
 
 class TestRailCipher(CipherTestBase):
     def test_rails_2(self):
@@ -70,6 +168,16 @@ class TestRailCipher(CipherTestBase):
         encoder = RailFenceCipher(rails=10)
         self.run_cipher_tests(encoder)
 
+    def test_cache_rails_change(self):
+        encoder = RailFenceCipher(rails=2, cache_size=8)
+        encoder.encode("Hello, World!")
+        encoder.rails = 3
+        self.assertEqual(encoder.encode("Hello, World!"), RailFenceCipher(rails=3).encode("Hello, World!"))
+
+    def test_invalid_text(self):
+        encoder = RailFenceCipher()
+        self.run_validation_tests(encoder)
+
 
 class TestCTC(CipherTestBase):
     def test_ctc_key1(self):
@@ -80,6 +188,15 @@ class TestCTC(CipherTestBase):
         encoder = ColumnarTranspositionCipher(key="world")
         self.run_cipher_tests(encoder)
 
+    def test_ctc_non_alpha_key(self):
+        encoder = ColumnarTranspositionCipher(key="k3y!")
+        self.assertEqual(encoder.order_list, [2, 1, 3, 0])
+        self.run_cipher_tests(encoder)
+
+    def test_invalid_text(self):
+        encoder = ColumnarTranspositionCipher()
+        self.run_validation_tests(encoder)
+
 
 if __name__ == '__main__':
     unittest.main()
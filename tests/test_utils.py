@@ -1,5 +1,9 @@
 import unittest
 import json
+import os
+import pickle
+import random
+import tempfile
 
 from encoding.utils import TextEncoder, Pipeline, Salt, StructuredDataEncoder, TextFileEncoder, JSONFileEncoder
 from encoding.ciphers.substitution import CaesarCipher, AtbashCipher, AffineCipher, VigenereCipher
@@ -22,6 +26,17 @@ sample_strings = [
 ]
 
 
+class TestTextEncoder(unittest.TestCase):
+    def test_invalid_signature(self):
+        with self.assertRaises(TypeError):
+            class InvalidEncoder(metaclass=TextEncoder):
+                def encode(self, data) -> str:
+                    return data
+
+                def decode(self, data) -> str:
+                    return data
+
+
 class TestPipeline(unittest.TestCase):
     def test_encode_without_salt(self):
         pipeline = Pipeline([
@@ -75,6 +90,39 @@ class TestPipeline(unittest.TestCase):
 
         self.assertEqual(pipeline.encoder_names, ['caesar_cipher', 'rail_cipher'])
 
+    def test_batch(self):
+        enc_strings = global_pipeline.encode_batch(sample_strings)
+
+        self.assertEqual(enc_strings, [global_pipeline.encode(sample_string) for sample_string in sample_strings])
+        self.assertEqual(global_pipeline.decode_batch(enc_strings), sample_strings)
+
+    def test_batch_after_changes(self):
+        pipeline = Pipeline([
+            (CaesarCipher(), 'caesar_cipher'),
+            (RailFenceCipher(), 'rail_cipher')
+        ])
+
+        pipeline.add_encoders([(Salt(), 'salt'), (VigenereCipher(), 'vigenere_cipher')])
+        pipeline.remove_encoders(['rail_cipher'])
+
+        enc_strings = pipeline.encode_batch(sample_strings)
+        self.assertEqual(enc_strings, [pipeline.encode(sample_string) for sample_string in sample_strings])
+        self.assertEqual(pipeline.decode_batch(enc_strings), sample_strings)
+
+    def test_duplicate_names(self):
+        with self.assertRaises(ValueError):
+            Pipeline([
+                (CaesarCipher(), 'cipher'),
+                (RailFenceCipher(), 'cipher')
+            ])
+
+    def test_invalid_encoder(self):
+        with self.assertRaises(ValueError):
+            Pipeline([
+                (CaesarCipher(), 'caesar'),
+                ("not an encoder", 'invalid')
+            ])
+
 
 class TestSalt(unittest.TestCase):
     def test_salt_front(self):
@@ -103,6 +151,36 @@ class TestSalt(unittest.TestCase):
 
             self.assertEqual(sample_string, desaulted_text)
 
+    def test_salt_reuse(self):
+        salt = Salt(position='between')
+        long_text = salt.encode("Hello, World!")
+        short_text = salt.encode("Hi")
+
+        self.assertEqual(Salt(position='between').encode("Hi"), short_text)
+        self.assertEqual(salt.encode("Hello, World!"), long_text)
+
+        salt.min_length = salt.max_length = 1
+        self.assertEqual(len(salt.encode("Hello")), 10)
+
+    def test_cache_size(self):
+        long_text = "Hello, World! " * 100
+        salted_text = Salt(position='between').encode(long_text)
+
+        for cache_size in (0, 5):
+            salt = Salt(position='between', cache_size=cache_size)
+            self.assertEqual(salt.encode(long_text), salted_text)
+            self.assertEqual(salt.decode(salted_text), long_text)
+
+    def test_global_random_untouched(self):
+        random.seed(1)
+        expected = random.random()
+
+        random.seed(1)
+        salt = Salt(position='between', random_seed=42)
+        salt.decode(salt.encode("Hello, World!"))
+
+        self.assertEqual(random.random(), expected)
+
 
 class TestSDE(unittest.TestCase):
     def test_list(self):
@@ -163,6 +241,52 @@ class TestSDE(unittest.TestCase):
 
         self.assertEqual(sample_set, dec_set)
 
+    def test_cache(self):
+        sample_list = [{'name': 'Alice', 'age': 30}, {'name': 'Bob', 'age': 30}, bytearray(b'bytearray')]
+
+        encoder = StructuredDataEncoder(encoder=global_pipeline, cache_size=16)
+        enc_list = encoder.encode(sample_list)
+        dec_list = encoder.decode(enc_list)
+
+        self.assertEqual(sample_list, dec_list)
+        self.assertEqual(enc_list, StructuredDataEncoder(encoder=global_pipeline).encode(sample_list))
+
+        copied_encoder = pickle.loads(pickle.dumps(encoder))
+        self.assertEqual(copied_encoder.decode(enc_list), sample_list)
+
+    def test_cache_param_change(self):
+        encoder = StructuredDataEncoder(encoder=CaesarCipher(shift=1), cache_size=16)
+        encoder.encode(['abc', 'abc'])
+        encoder.encoder.shift = 2
+
+        self.assertEqual(encoder.encode(['abc', 'abc']),
+                         StructuredDataEncoder(encoder=CaesarCipher(shift=2)).encode(['abc', 'abc']))
+
+    def test_leaf_parsing(self):
+        sample_list = ["I'm", "back\\slash", float('inf'), 10 ** 30, complex(1, -2), range(1, 9, 2), b"q'"]
+
+        encoder = StructuredDataEncoder(encoder=CaesarCipher())
+        dec_list = encoder.decode(encoder.encode(sample_list))
+
+        self.assertEqual(sample_list, dec_list)
+
+        with self.assertRaises(ValueError):
+            encoder.decode(CaesarCipher().encode("__import__('os').getcwd()"))
+
+    def test_deep_nesting(self):
+        sample_list = inner = []
+        for _ in range(2000):
+            inner.append([])
+            inner = inner[0]
+        inner.append(42)
+
+        encoder = StructuredDataEncoder(encoder=CaesarCipher())
+        dec_list = encoder.decode(encoder.encode(sample_list))
+
+        for _ in range(2000):
+            dec_list = dec_list[0]
+        self.assertEqual(dec_list, [42])
+
 
 class TestTFE(unittest.TestCase):
     def test(self):
@@ -179,6 +303,105 @@ class TestTFE(unittest.TestCase):
 
         self.assertEqual(sample_text, decoded_text)
 
+    def test_file_out(self):
+        encoder = TextFileEncoder(encoder=global_pipeline)
+
+        with open("sample_text_file.txt", 'r') as file:
+            sample_text = file.read()
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            enc_file = os.path.join(tmp_dir, "encoded.txt")
+            dec_file = os.path.join(tmp_dir, "decoded.txt")
+            encoder.encode(file="sample_text_file.txt", file_out=enc_file)
+            encoder.decode(file=enc_file, file_out=dec_file)
+
+            with open(dec_file, 'r') as file:
+                decoded_text = file.read()
+
+        self.assertEqual(sample_text, decoded_text)
+
+    def test_workers(self):
+        pipeline = Pipeline([(global_pipeline, 'pipeline'), (CaesarCipher(cache_size=8), 'cached_caesar')])
+        encoder = TextFileEncoder(encoder=pipeline, batch_size=2, workers=2)
+
+        with open("sample_text_file.txt", 'r') as file:
+            sample_text = file.read()
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            enc_file = os.path.join(tmp_dir, "encoded.txt")
+            serial_file = os.path.join(tmp_dir, "serial.txt")
+            dec_file = os.path.join(tmp_dir, "decoded.txt")
+            encoder.encode(file="sample_text_file.txt", file_out=enc_file)
+            TextFileEncoder(encoder=pipeline).encode(file="sample_text_file.txt", file_out=serial_file)
+            encoder.decode(file=enc_file, file_out=dec_file)
+
+            with open(enc_file, 'r') as file:
+                enc_text = file.read()
+            with open(serial_file, 'r') as file:
+                serial_text = file.read()
+            with open(dec_file, 'r') as file:
+                decoded_text = file.read()
+
+        self.assertEqual(enc_text, serial_text)
+        self.assertEqual(sample_text, decoded_text)
+
+    def test_symlink(self):
+        encoder = TextFileEncoder(encoder=CaesarCipher(shift=1))
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            real_file = os.path.join(tmp_dir, "real.txt")
+            link_file = os.path.join(tmp_dir, "link.txt")
+            with open(real_file, 'w') as file:
+                file.write("hello\n")
+            os.symlink(real_file, link_file)
+
+            encoder.encode(file=link_file)
+
+            with open(real_file, 'r') as file:
+                enc_text = file.read()
+
+            self.assertTrue(os.path.islink(link_file))
+            self.assertEqual(enc_text, "ifmmp\n")
+
+            with self.assertRaises(FileNotFoundError):
+                encoder.encode(file=os.path.join(tmp_dir, "missing.txt"))
+            self.assertEqual(sorted(os.listdir(tmp_dir)), ["link.txt", "real.txt"])
+
+    def test_file_out_same_as_file(self):
+        encoder = TextFileEncoder(encoder=CaesarCipher(shift=1))
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            text_file = os.path.join(tmp_dir, "text.txt")
+            link_file = os.path.join(tmp_dir, "link.txt")
+            with open(text_file, 'w') as file:
+                file.write("hello\n")
+            os.symlink(text_file, link_file)
+
+            encoder.encode(file=text_file, file_out=text_file)
+            encoder.encode(file=text_file, file_out=link_file)
+
+            with open(text_file, 'r') as file:
+                enc_text = file.read()
+
+        self.assertEqual(enc_text, "jgnnq\n")
+
+    def test_whitespace(self):
+        encoder = TextFileEncoder(encoder=CaesarCipher(shift=1))
+        sample_text = "    indented\ntrailing  \n\n }leading symbol\n"
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            text_file = os.path.join(tmp_dir, "text.txt")
+            with open(text_file, 'w') as file:
+                file.write(sample_text)
+
+            encoder.encode(file=text_file)
+            encoder.decode(file=text_file)
+
+            with open(text_file, 'r') as file:
+                decoded_text = file.read()
+
+        self.assertEqual(sample_text, decoded_text)
+
 
 class TestJFE(unittest.TestCase):
     def test(self):